@@ -0,0 +1,49 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+_srt_fast.pyx
+Optional compiled build of ai_service.format_srt. ai_service.py falls back to the
+pure-Python version when this module isn't built.
+
+Build in place (done by scripts/bootstrap_venv.mjs):
+  python -m Cython.Build.Cythonize -i _srt_fast.pyx
+"""
+
+from libc.math cimport nearbyint
+from libc.stdio cimport snprintf
+
+
+cdef long long _ms(double seconds):
+    # nearbyint rounds half to even, matching Python's round() in srt_ts
+    if seconds < 0:
+        seconds = 0.0
+    return <long long>nearbyint(seconds * 1000.0)
+
+
+def format_srt(long long first_idx, list starts, list ends, list ens, list zhs):
+    """
+    Format consecutive cues as SRT blocks, numbered from first_idx.
+    Output is identical to ai_service._format_srt_py.
+    """
+    cdef Py_ssize_t i, n = len(starts)
+    cdef long long a, b
+    cdef int w
+    cdef char buf[96]
+    cdef list out = []
+
+    for i in range(n):
+        a = _ms(starts[i])
+        b = _ms(ends[i])
+        w = snprintf(
+            buf, sizeof(buf),
+            "%lld\n%02lld:%02lld:%02lld,%03lld --> %02lld:%02lld:%02lld,%03lld\n",
+            first_idx + i,
+            a // 3600000, (a // 60000) % 60, (a // 1000) % 60, a % 1000,
+            b // 3600000, (b // 60000) % 60, (b // 1000) % 60, b % 1000,
+        )
+        out.append(buf[:w].decode("ascii"))
+        out.append(ens[i])
+        out.append("\n")
+        out.append(zhs[i])
+        out.append("\n\n")
+
+    return "".join(out)
@@ -5,9 +5,15 @@
 ai_service.py
 Invoked as:
   python ai_service.py <inputPath> <srtPath>
+or as a long-lived worker that keeps models loaded between jobs:
+  python ai_service.py --daemon
+reading one JSON job per stdin line:
+  {"id":"...","input_path":"...","output_srt_path":"..."}
 
 Emits JSONL progress to stdout:
   {"stage":"transcribe","progress":25,"message":"..."}
+In daemon mode progress lines carry "job":"<id>", and each job ends with:
+  {"event":"done","job":"<id>","ok":true,"error":null}
 
 Generates bilingual SRT with strict 2-line cues:
   English (single line)
@@ -17,22 +23,77 @@ Generates bilingual SRT with strict 2-line cues:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
+import queue
 import re
 import sys
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 
 # -------------------------
 # JSON progress (stdout)
 # -------------------------
-def emit(stage: str, progress: int, message: str) -> None:
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib encoder
+    orjson = None
+
+_job_id: Optional[str] = None  # set while a daemon job runs
+
+
+def write_json_line(obj: dict) -> None:
     # Node expects JSON per line on stdout
-    print(json.dumps({"stage": stage, "progress": int(progress), "message": message}, ensure_ascii=False), flush=True)
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(obj) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(obj, ensure_ascii=False), flush=True)
+
+
+# Same-stage progress is written at most every _EMIT_INTERVAL seconds; in between,
+# only the latest update is kept. It goes out before the next stage's first message,
+# on the next write after the interval, or on flush_progress().
+_EMIT_INTERVAL = 0.2
+_last_emit = 0.0
+_last_stage: Optional[str] = None
+_pending_emit: Optional[dict] = None
+
+
+def emit(stage: str, progress: int, message: str) -> None:
+    global _last_emit, _last_stage, _pending_emit
+
+    msg = {"stage": stage, "progress": int(progress), "message": message}
+    if _job_id is not None:
+        msg["job"] = _job_id
+
+    now = time.monotonic()
+    if stage == _last_stage and msg["progress"] < 100 and now - _last_emit < _EMIT_INTERVAL:
+        _pending_emit = msg
+        return
+
+    if stage != _last_stage:
+        # The held update is the previous stage's latest (often its summary); send it first
+        flush_progress()
+    _pending_emit = None
+    _last_emit, _last_stage = now, stage
+    write_json_line(msg)
+
+
+def flush_progress() -> None:
+    global _last_emit, _pending_emit
+    if _pending_emit is not None:
+        write_json_line(_pending_emit)
+        _pending_emit = None
+        _last_emit = time.monotonic()
 
 
 def eprint(*args) -> None:
@@ -44,46 +105,76 @@ def eprint(*args) -> None:
 # SRT helpers
 # -------------------------
 _WS = re.compile(r"\s+")
+_WORD = re.compile(r"\S+")
+_PUNCT_SPLIT = re.compile(r"([,，。.!?！？；;:])")
 
 
 def clean_one_line(text: str) -> str:
-    text = (text or "").replace("\r", " ").replace("\n", " ")
-    text = _WS.sub(" ", text).strip()
-    return text
+    # \s already covers \r and \n, so one pass collapses everything to a single line
+    return _WS.sub(" ", text or "").strip()
+
+
+def maybe_clean(text: str) -> str:
+    # Cheap path for translator output, which is normally single-line already;
+    # only fall back to the regex when there is whitespace to collapse.
+    if "\n" in text or "\r" in text or "  " in text or "\t" in text:
+        return _WS.sub(" ", text).strip()
+    return text.strip()
 
 
 def srt_ts(seconds: float) -> str:
     if seconds < 0:
         seconds = 0.0
-    ms = int(round(seconds * 1000.0))
-    hh = ms // 3_600_000
-    ms -= hh * 3_600_000
-    mm = ms // 60_000
-    ms -= mm * 60_000
-    ss = ms // 1_000
-    ms -= ss * 1_000
+    hh, ms = divmod(int(round(seconds * 1000.0)), 3_600_000)
+    mm, ms = divmod(ms, 60_000)
+    ss, ms = divmod(ms, 1_000)
     return f"{hh:02d}:{mm:02d}:{ss:02d},{ms:03d}"
 
 
+def _format_srt_py(first_idx: int, starts: List[float], ends: List[float], ens: List[str], zhs: List[str]) -> str:
+    """
+    Format consecutive cues as SRT blocks, numbered from first_idx.
+    One f-string per cue; srt_ts is bound locally to skip the global lookup per call.
+    """
+    _srt_ts = srt_ts
+    return "".join(
+        f"{idx}\n{_srt_ts(s0)} --> {_srt_ts(s1)}\n{en}\n{zh}\n\n"
+        for idx, s0, s1, en, zh in zip(range(first_idx, first_idx + len(starts)), starts, ends, ens, zhs)
+    )
+
+
+# Compiled build of the same formatter, if scripts/bootstrap_venv.mjs managed to build it
+try:
+    from _srt_fast import format_srt
+except ImportError:
+    format_srt = _format_srt_py
+
+
 def split_text_chunks(text: str, max_chars: int) -> List[str]:
     """
     Split into single-line chunks (no wrapping) with <= max_chars when possible.
     Prefers punctuation boundaries.
     """
-    t = clean_one_line(text)
+    return _split_clean_text(clean_one_line(text), max_chars)
+
+
+def _split_clean_text(t: str, max_chars: int) -> List[str]:
+    # t must already be clean_one_line() output; chunks come back clean (single-spaced, stripped)
     if not t:
         return []
     if len(t) <= max_chars:
         return [t]
 
     # Punctuation-based split (keep punctuation)
-    parts = re.split(r"([,，。.!?！？；;:])", t)
+    parts = _PUNCT_SPLIT.split(t)
     chunks: List[str] = []
     cur = ""
     for i in range(0, len(parts), 2):
         piece = parts[i]
         punct = parts[i + 1] if i + 1 < len(parts) else ""
-        cand = (cur + " " + piece + punct).strip() if cur else (piece + punct).strip()
+        # piece keeps the space that followed the previous punctuation; drop it before
+        # joining so chunks stay single-spaced
+        cand = (cur + " " + piece.lstrip() + punct).strip() if cur else (piece + punct).strip()
         if len(cand) <= max_chars:
             cur = cand
         else:
@@ -99,18 +190,21 @@ def split_text_chunks(text: str, max_chars: int) -> List[str]:
         if len(c) <= max_chars:
             final.append(c)
             continue
-        words = c.split(" ")
-        buf = ""
-        for w in words:
-            cand = (buf + " " + w).strip() if buf else w
-            if len(cand) <= max_chars:
-                buf = cand
+        buf: List[str] = []
+        length = 0  # length of " ".join(buf)
+        for m in _WORD.finditer(c):
+            w = m.group()
+            cand_len = length + 1 + len(w) if buf else len(w)
+            if cand_len <= max_chars:
+                buf.append(w)
+                length = cand_len
             else:
                 if buf:
-                    final.append(buf)
-                buf = w
+                    final.append(" ".join(buf))
+                buf = [w]
+                length = len(w)
         if buf:
-            final.append(buf)
+            final.append(" ".join(buf))
 
     # Worst-case: hard slice (e.g., long Chinese with no punctuation)
     out: List[str] = []
@@ -118,13 +212,16 @@ def split_text_chunks(text: str, max_chars: int) -> List[str]:
         if len(c) <= max_chars:
             out.append(c)
         else:
-            for i in range(0, len(c), max_chars):
-                out.append(c[i : i + max_chars].strip())
+            # Only a single over-long word gets here, so slices have no whitespace to strip
+            out.extend(c[i : i + max_chars] for i in range(0, len(c), max_chars))
     return [x for x in out if x]
 
 
 @dataclass
 class Segment:
+    # Slotted: one small fixed-layout record per cue instead of a per-instance dict
+    __slots__ = ("start", "end", "text")
+
     start: float
     end: float
     text: str
@@ -148,47 +245,102 @@ def split_segment_by_chunks(seg: Segment, chunks: List[str], min_piece_dur: floa
     return out
 
 
+def prepare_cues(seg: Segment, max_chars: int) -> List[Segment]:
+    """
+    Clean, split and time one segment's text into single-line cues.
+    Text is cleaned once; the returned cue texts are already clean and non-empty.
+    """
+    t = clean_one_line(seg.text)
+    if not t:
+        return []
+    return split_segment_by_chunks(seg, _split_clean_text(t, max_chars))
+
+
+# Cues are translated in batches of up to _BATCH_SIZE, or whatever arrived within
+# _BATCH_WAIT seconds, while transcription keeps producing segments.
+_BATCH_SIZE = 32
+_BATCH_WAIT = 0.2
+
+
 def write_bilingual_srt(
-    segments: List[Segment],
+    segments: Iterable[Segment],
     out_path: Path,
-    make_pair: Callable[[str], Tuple[str, str]],
+    translate_batch: Callable[[List[str]], List[str]],
+    source_is_zh: bool,
     max_chars_src: int,
 ) -> None:
     """
-    make_pair(src_text) -> (english, chinese), both single-line.
+    translate_batch(src_texts) -> translations parallel to src_texts.
+    source_is_zh picks which side the source lines go on (EN is always on top).
     Splits the *source* text into chunks first to keep cues short and single-line.
+
+    segments may be a lazy iterator (live Whisper output): cues are queued as they are
+    produced and a writer thread translates them in small batches and streams them to
+    disk in order, so translation overlaps transcription.
     """
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    lines: List[str] = []
-    idx = 1
-
-    for seg in segments:
-        src = clean_one_line(seg.text)
-        if not src:
-            continue
-
-        src_chunks = split_text_chunks(src, max_chars=max_chars_src)
-        sub_segments = split_segment_by_chunks(seg, src_chunks)
-
-        for sseg in sub_segments:
-            src_piece = clean_one_line(sseg.text)
-            if not src_piece:
-                continue
-
-            en, zh = make_pair(src_piece)
-            en = clean_one_line(en)
-            zh = clean_one_line(zh)
-
-            # Enforce exactly two lines per cue
-            lines.append(str(idx))
-            lines.append(f"{srt_ts(sseg.start)} --> {srt_ts(sseg.end)}")
-            lines.append(en)
-            lines.append(zh)
-            lines.append("")
-            idx += 1
+    cue_queue: "queue.Queue[Optional[Segment]]" = queue.Queue()
+    errors: List[BaseException] = []
+
+    def _next_batch() -> Tuple[List[Segment], bool]:
+        # Block for the first cue, then keep taking until the batch is full or the wait expires
+        first = cue_queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + _BATCH_WAIT
+        while len(batch) < _BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                cue = cue_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if cue is None:
+                return batch, True
+            batch.append(cue)
+        return batch, False
+
+    def _writer() -> None:
+        try:
+            # Stream cues to disk through a 1 MiB buffer
+            with out_path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+                idx = 1
+                done = False
+                while not done:
+                    batch, done = _next_batch()
+                    if not batch:
+                        continue
+
+                    # Enforce exactly two lines per cue. Both sides get the cheap single-line
+                    # check: it's a no-op for prepare_cues output but keeps the SRT correct
+                    # if a chunking path ever leaves extra whitespace behind.
+                    src_lines = [maybe_clean(c.text) for c in batch]
+                    tgt_lines = [maybe_clean(t) for t in translate_batch(src_lines)]
+                    en_lines, zh_lines = (tgt_lines, src_lines) if source_is_zh else (src_lines, tgt_lines)
+
+                    f.write(format_srt(idx, [c.start for c in batch], [c.end for c in batch], en_lines, zh_lines))
+                    idx += len(batch)
+        except BaseException as ex:
+            errors.append(ex)
+
+    writer = threading.Thread(target=_writer, name="srt-writer", daemon=True)
+    writer.start()
+    try:
+        for seg in segments:
+            if errors:
+                break
+            for cue in prepare_cues(seg, max_chars_src):
+                cue_queue.put(cue)
+        emit("translate", 50, "Translating remaining cues...")
+    finally:
+        cue_queue.put(None)
+        writer.join()
 
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    if errors:
+        raise errors[0]
 
 
 # -------------------------
@@ -207,7 +359,7 @@ def ensure_argos(from_code: str, to_code: str) -> None:
     if has_translation():
         return
 
-    emit("translate", 42, f"Argos model missing for {from_code}->{to_code}. Downloading...")
+    emit("translate", 22, f"Argos model missing for {from_code}->{to_code}. Downloading...")
 
     argostranslate.package.update_package_index()
     available = argostranslate.package.get_available_packages()
@@ -257,7 +409,9 @@ def ensure_argos(from_code: str, to_code: str) -> None:
         raise RuntimeError(f"Failed to install Argos model for {from_code}->{to_code}")
 
 
-def make_argos_translator(from_code: str, to_code: str) -> Callable[[str], str]:
+@functools.lru_cache(maxsize=4)
+def _get_translation(from_code: str, to_code: str):
+    """Look up the installed Argos ITranslation once per direction."""
     import argostranslate.translate
 
     langs = argostranslate.translate.get_installed_languages()
@@ -269,6 +423,11 @@ def make_argos_translator(from_code: str, to_code: str) -> Callable[[str], str]:
     tr = fr.get_translation(to)
     if tr is None:
         raise RuntimeError(f"Argos translation not available: {from_code}->{to_code}")
+    return tr
+
+
+def make_argos_translator(from_code: str, to_code: str) -> Callable[[str], str]:
+    tr = _get_translation(from_code, to_code)
 
     def _t(text: str) -> str:
         return tr.translate(text)
@@ -276,88 +435,300 @@ def make_argos_translator(from_code: str, to_code: str) -> Callable[[str], str]:
     return _t
 
 
+def with_translation_cache(
+    translate_batch: Callable[[List[str]], List[str]], maxsize: int = 8192
+) -> Callable[[List[str]], List[str]]:
+    """
+    Wrap a batch translator with an LRU cache keyed by source line. Lines repeated
+    within a batch or across batches (fillers like "Yeah.") are translated once.
+    """
+    cache: "OrderedDict[str, str]" = OrderedDict()
+
+    def _cached(texts: List[str]) -> List[str]:
+        missing = list(dict.fromkeys(t for t in texts if t not in cache))
+        fresh = dict(zip(missing, translate_batch(missing))) if missing else {}
+
+        out: List[str] = []
+        for t in texts:
+            if t in fresh:
+                out.append(fresh[t])
+            else:
+                cache.move_to_end(t)
+                out.append(cache[t])
+
+        cache.update(fresh)
+        while len(cache) > maxsize:
+            cache.popitem(last=False)
+        return out
+
+    return _cached
+
+
+def resolve_translate_device(device: str) -> str:
+    # "auto" => cuda when CTranslate2 sees a GPU
+    if device != "auto":
+        return device
+    import ctranslate2
+
+    return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+
+def split_cpu_threads(whisper_device: str, translate_device: str) -> Tuple[int, int]:
+    """
+    Returns (whisper_cpu_threads, translate_workers). Transcription and translation
+    overlap, so when both run on CPU they split the cores instead of each claiming all.
+    """
+    cores = os.cpu_count() or 1
+    if whisper_device == "cpu" and translate_device == "cpu":
+        translate_workers = max(1, cores // 2)
+        return max(1, cores - translate_workers), translate_workers
+    return cores, cores
+
+
+@functools.lru_cache(maxsize=4)
+def make_argos_batch_translator(
+    from_code: str, to_code: str, device: str = "auto", cpu_workers: int = 0
+) -> Callable[[List[str]], List[str]]:
+    """
+    Translate a list of single-line strings with batched CTranslate2 calls, using the
+    model and SentencePiece tokenizer packaged with the Argos model. device is
+    "cpu", "cuda" or "auto" (cuda when CTranslate2 sees a GPU); on CPU the batch is
+    sharded across cpu_workers cores (0 => all of them).
+    Falls back to per-line Argos translation for packages without a SentencePiece model.
+    Cached per direction so the model is loaded once per process; each direction also
+    keeps its own cache of translated lines.
+    """
+    import argostranslate.package
+
+    pkgs = argostranslate.package.get_installed_packages()
+    pkg = next((p for p in pkgs if p.from_code == from_code and p.to_code == to_code), None)
+    pkg_dir = Path(pkg.package_path) if pkg else None
+
+    if pkg_dir is None or not (pkg_dir / "sentencepiece.model").exists():
+        eprint(f"No SentencePiece model for {from_code}->{to_code}; translating line by line.")
+        tr = make_argos_translator(from_code, to_code)
+
+        def _fallback(texts: List[str]) -> List[str]:
+            return [tr(t) for t in texts]
+
+        return with_translation_cache(_fallback)
+
+    import ctranslate2
+    import sentencepiece
+
+    device = resolve_translate_device(device)
+
+    if device == "cuda":
+        # The GPU takes each batch whole; int8 weights with fp16 activations
+        workers, compute_type = 1, "int8_float16"
+    else:
+        # One CTranslate2 worker per core; shards of the batch are submitted concurrently
+        # (translate_batch releases the GIL) and each worker runs single-threaded.
+        workers, compute_type = cpu_workers or os.cpu_count() or 1, "int8"
+
+    eprint(f"Argos {from_code}->{to_code}: CTranslate2 on {device}/{compute_type}")
+    translator = ctranslate2.Translator(
+        str(pkg_dir / "model"),
+        device=device,
+        compute_type=compute_type,
+        inter_threads=workers,
+        intra_threads=1 if device == "cpu" else 0,
+    )
+    sp = sentencepiece.SentencePieceProcessor(model_file=str(pkg_dir / "sentencepiece.model"))
+    target_prefix = getattr(pkg, "target_prefix", "") or ""
+
+    def _translate_shard(tokens: List[List[str]]) -> List[str]:
+        results = translator.translate_batch(
+            tokens,
+            target_prefix=[[target_prefix]] * len(tokens) if target_prefix else None,
+            max_batch_size=32,
+            beam_size=1,
+            replace_unknowns=True,
+        )
+        out: List[str] = []
+        for r in results:
+            hyp = r.hypotheses[0]
+            if target_prefix and hyp and hyp[0] == target_prefix:
+                hyp = hyp[1:]
+            out.append(sp.decode(hyp))
+        return out
+
+    def _tb(texts: List[str]) -> List[str]:
+        if not texts:
+            return []
+        tokens = sp.encode(texts, out_type=str)
+
+        # Length-bucket: sorted inputs keep each padded batch close to uniform length
+        order = sorted(range(len(tokens)), key=lambda i: len(tokens[i]))
+        ordered = [tokens[i] for i in order]
+        size = -(-len(ordered) // workers)
+        shards = [ordered[i : i + size] for i in range(0, len(ordered), size)]
+
+        translated: List[str] = []
+        with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+            for res in pool.map(_translate_shard, shards):  # in submission order
+                translated.extend(res)
+
+        out = [""] * len(texts)
+        for i, t in zip(order, translated):
+            out[i] = t
+        return out
+
+    return with_translation_cache(_tb)
+
+
 # -------------------------
 # faster-whisper transcription
 # -------------------------
-def transcribe(input_path: Path, model_name: str, device: str, compute_type: str, language: Optional[str]) -> Tuple[List[Segment], str]:
+@functools.lru_cache(maxsize=2)
+def _get_whisper_model(model_name: str, device: str, compute_type: str, cpu_threads: int = 0):
+    """Load a WhisperModel once per process (reused across daemon jobs)."""
     from faster_whisper import WhisperModel
 
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads or os.cpu_count() or 0,
+        num_workers=2,
+    )
+
+
+def transcribe(
+    input_path: Path,
+    model_name: str,
+    device: str,
+    compute_type: str,
+    language: Optional[str],
+    beam_size: int = 1,
+    cpu_threads: int = 0,
+) -> Tuple[Iterator[Segment], str]:
+    """
+    Returns (segments, detected_language). Language detection runs up front; segments
+    is a lazy iterator and transcription happens as it is consumed.
+    """
     emit("transcribe", 10, f"Loading Whisper model '{model_name}' ({device}/{compute_type})...")
-    model = WhisperModel(model_name, device=device, compute_type=compute_type)
+    model = _get_whisper_model(model_name, device, compute_type, cpu_threads)
 
     emit("transcribe", 18, "Transcribing...")
-    seg_iter, info = model.transcribe(str(input_path), vad_filter=True, language=language)
+    # Greedy decoding without cross-segment conditioning: much faster, and subtitles
+    # don't benefit from the long-context consistency it buys.
+    seg_iter, info = model.transcribe(
+        str(input_path),
+        language=language,
+        beam_size=beam_size,
+        condition_on_previous_text=False,
+        vad_filter=True,
+        vad_parameters={"min_silence_duration_ms": 500},
+    )
 
     detected = (info.language or (language or "auto")).lower()
-    segments: List[Segment] = []
 
-    for i, s in enumerate(seg_iter):
-        segments.append(Segment(float(s.start), float(s.end), str(s.text)))
-        if i == 0:
-            emit("transcribe", 28, "Receiving segments...")
-        elif i % 25 == 0:
-            emit("transcribe", 33, f"Transcribed {i} segments...")
+    def _segments() -> Iterator[Segment]:
+        for i, s in enumerate(seg_iter):
+            yield Segment(float(s.start), float(s.end), str(s.text))
+            if i == 0:
+                emit("transcribe", 28, "Receiving segments...")
+            elif i % 25 == 0:
+                emit("transcribe", 33, f"Transcribed {i} segments...")
+
+        emit("transcribe", 40, f"Transcription complete. Detected language: {detected}")
+
+    return _segments(), detected
+
+
+def run_job(in_path: Path, out_srt: Path, args: argparse.Namespace) -> None:
+    if not in_path.exists():
+        raise FileNotFoundError(f"Input file not found: {in_path}")
 
-    emit("transcribe", 40, f"Transcription complete. Detected language: {detected}")
-    return segments, detected
+    emit("extract_audio", 5, "Preparing media for transcription (ffmpeg required)...")
+
+    forced_lang = args.language.strip() or None
+    compute_type = args.compute_type.strip() or ("int8_float16" if args.device == "cuda" else "int8")
+    translate_device = resolve_translate_device(args.translate_device)
+    whisper_threads, translate_workers = split_cpu_threads(args.device, translate_device)
+    segments, detected = transcribe(
+        in_path, args.model, args.device, compute_type, forced_lang, args.beam_size, whisper_threads
+    )
+
+    # Always output EN on top, ZH on bottom.
+    # If audio is English-ish: EN source, translate EN->ZH
+    # If audio is Chinese-ish: ZH source, translate ZH->EN (but still output EN then ZH)
+    detected_is_zh = detected.startswith("zh")
+
+    emit("translate", 20, "Ensuring Argos translation model is installed...")
+    src_code, tgt_code = ("zh", "en") if detected_is_zh else ("en", "zh")
+    ensure_argos(src_code, tgt_code)
+    translate_batch = make_argos_batch_translator(src_code, tgt_code, translate_device, translate_workers)
+    translate_batch(["预热" if detected_is_zh else "warmup"])  # warm up: load the model before the SRT pass
+    max_chars_src = args.max_chars_zh if detected_is_zh else args.max_chars_en
+
+    emit("transcribe", 25, "Transcribing and translating bilingual SRT (EN on top, ZH below)...")
+    write_bilingual_srt(
+        segments,
+        out_srt,
+        translate_batch=translate_batch,
+        source_is_zh=detected_is_zh,
+        max_chars_src=max_chars_src,
+    )
+
+    emit("srt", 80, f"Wrote SRT: {out_srt}")
+    emit("srt", 84, "SRT generation finished.")
+
+
+def serve(args: argparse.Namespace) -> int:
+    """
+    Daemon mode: run jobs from stdin one at a time, keeping Whisper and the
+    translators loaded (see the lru_caches above) between jobs.
+    """
+    global _job_id
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        ok, error = True, None
+        try:
+            job = json.loads(line)
+            _job_id = str(job.get("id", ""))
+            run_job(
+                Path(job["input_path"]).expanduser().resolve(),
+                Path(job["output_srt_path"]).expanduser().resolve(),
+                args,
+            )
+        except Exception as ex:
+            eprint(f"ai_service.py job {_job_id} failed: {ex}")
+            ok, error = False, str(ex)
+        flush_progress()
+        write_json_line({"event": "done", "job": _job_id, "ok": ok, "error": error})
+        _job_id = None
+    return 0
 
 
 def main() -> int:
     ap = argparse.ArgumentParser()
-    ap.add_argument("input_path")
-    ap.add_argument("output_srt_path")
+    ap.add_argument("input_path", nargs="?")
+    ap.add_argument("output_srt_path", nargs="?")
+    ap.add_argument("--daemon", action="store_true", help="serve JSONL jobs from stdin")
     ap.add_argument("--model", default=os.getenv("WHISPER_MODEL", "small"))
     ap.add_argument("--device", default=os.getenv("WHISPER_DEVICE", "cpu"))
-    ap.add_argument("--compute_type", default=os.getenv("WHISPER_COMPUTE_TYPE", "int8"))
+    ap.add_argument("--compute_type", default=os.getenv("WHISPER_COMPUTE_TYPE", ""))  # empty => per device
+    ap.add_argument("--beam_size", type=int, default=int(os.getenv("WHISPER_BEAM_SIZE", "1")))
     ap.add_argument("--language", default=os.getenv("WHISPER_LANGUAGE", ""))  # empty => auto
+    ap.add_argument("--translate_device", default=os.getenv("ARGOS_DEVICE", "auto"))  # auto => cuda if available
     ap.add_argument("--max_chars_en", type=int, default=int(os.getenv("SRT_MAX_CHARS_EN", "45")))
     ap.add_argument("--max_chars_zh", type=int, default=int(os.getenv("SRT_MAX_CHARS_ZH", "22")))
     args = ap.parse_args()
 
+    if args.daemon:
+        return serve(args)
+    if not args.input_path or not args.output_srt_path:
+        ap.error("input_path and output_srt_path are required unless --daemon is given")
+
     in_path = Path(args.input_path).expanduser().resolve()
     out_srt = Path(args.output_srt_path).expanduser().resolve()
 
     try:
-        if not in_path.exists():
-            raise FileNotFoundError(f"Input file not found: {in_path}")
-
-        emit("extract_audio", 5, "Preparing media for transcription (ffmpeg required)...")
-
-        forced_lang = args.language.strip() or None
-        segments, detected = transcribe(in_path, args.model, args.device, args.compute_type, forced_lang)
-
-        # Always output EN on top, ZH on bottom.
-        # If audio is English-ish: EN source, translate EN->ZH
-        # If audio is Chinese-ish: ZH source, translate ZH->EN (but still output EN then ZH)
-        detected_is_zh = detected.startswith("zh")
-
-        emit("translate", 45, "Ensuring Argos translation model is installed...")
-        if detected_is_zh:
-            ensure_argos("zh", "en")
-            zh2en = make_argos_translator("zh", "en")
-
-            def make_pair(src_zh: str) -> Tuple[str, str]:
-                zh_line = src_zh
-                en_line = zh2en(src_zh)
-                return en_line, zh_line
-
-            max_chars_src = args.max_chars_zh
-        else:
-            ensure_argos("en", "zh")
-            en2zh = make_argos_translator("en", "zh")
-
-            def make_pair(src_en: str) -> Tuple[str, str]:
-                en_line = src_en
-                zh_line = en2zh(src_en)
-                return en_line, zh_line
-
-            max_chars_src = args.max_chars_en
-
-        emit("srt", 60, "Generating bilingual SRT (EN on top, ZH below)...")
-        write_bilingual_srt(segments, out_srt, make_pair=make_pair, max_chars_src=max_chars_src)
-
-        emit("srt", 80, f"Wrote SRT: {out_srt}")
-        emit("srt", 84, "SRT generation finished.")
+        run_job(in_path, out_srt, args)
         return 0
 
     except Exception as ex:
@@ -365,6 +736,9 @@ def main() -> int:
         eprint(f"ai_service.py failed: {ex}")
         return 1
 
+    finally:
+        flush_progress()
+
 
 if __name__ == "__main__":
     raise SystemExit(main())
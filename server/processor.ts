@@ -1,13 +1,113 @@
 
 import fs from 'fs';
 import path from 'path';
-import { spawn } from 'child_process';
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
 import ffmpeg from 'fluent-ffmpeg';
 import { Job, Cue, RenderConfig, JobResult } from './types.js';
 import { parseSrt } from './utils.js';
 
 const DATA_DIR = path.resolve((process as any).cwd(), 'data');
 
+// Persistent ai_service.py worker (--daemon): Whisper and Argos models stay loaded
+// between jobs. Jobs are written to its stdin as JSONL and run one at a time, so
+// concurrent uploads queue behind each other (there is no per-job timeout);
+// progress lines and the final {"event":"done"} line are tagged with the job id.
+interface AiTask {
+  onProgress: (msg: any) => void;
+  resolve: () => void;
+  reject: (err: Error) => void;
+}
+
+let aiWorker: ChildProcessWithoutNullStreams | null = null;
+let aiStderr = '';
+const aiTasks = new Map<string, AiTask>();
+
+const failAiTasks = (err: Error) => {
+  for (const task of aiTasks.values()) task.reject(err);
+  aiTasks.clear();
+};
+
+const getAiWorker = (): ChildProcessWithoutNullStreams => {
+  if (aiWorker) return aiWorker;
+
+  const pythonScript = path.join((process as any).cwd(), 'ai_service.py');
+  const venvPython =
+    process.platform === "win32"
+      ? path.join(process.cwd(), ".venv", "Scripts", "python.exe")
+      : path.join(process.cwd(), ".venv", "bin", "python");
+
+  const python = spawn(venvPython, [pythonScript, '--daemon'], {
+    env: {
+      ...process.env,
+      STANZA_RESOURCES_DIR: path.join(process.cwd(), ".stanza"),
+    },
+  });
+  aiWorker = python;
+  aiStderr = '';
+
+  // Catch spawn errors (e.g., ENOENT if python is missing)
+  // Both handlers ignore a stale process: after a spawn error a replacement worker may
+  // already be running (and own the pending tasks) by the time the old one closes.
+  python.on('error', (err) => {
+    if (aiWorker !== python) return;
+    aiWorker = null;
+    failAiTasks(new Error(`Failed to spawn python command "${venvPython}". Make sure the venv is bootstrapped (npm run bootstrap:py). Details: ${err.message}`));
+  });
+
+  // stdout chunks can split lines; only parse complete ones
+  let pending = '';
+  python.stdout.on('data', (data) => {
+    pending += data.toString();
+    const lines = pending.split('\n');
+    pending = lines.pop() ?? '';
+    for (const line of lines) {
+      if (!line.trim()) continue;
+      let msg: any;
+      try {
+        msg = JSON.parse(line);
+      } catch (e) {
+        console.log(`[Python Log]: ${line}`);
+        continue;
+      }
+      const task = msg.job ? aiTasks.get(msg.job) : undefined;
+      if (!task) continue;
+      if (msg.event === 'done') {
+        aiTasks.delete(msg.job);
+        if (msg.ok) task.resolve();
+        else task.reject(new Error(`AI Service failed: ${msg.error || aiStderr || 'Unknown error'}`));
+        aiStderr = '';
+      } else if (msg.stage) {
+        task.onProgress(msg);
+      }
+    }
+  });
+
+  // Writes after the worker died fail with EPIPE; 'close' already rejects the tasks
+  python.stdin.on('error', (err) => {
+    console.error(`[Python Error]: stdin: ${err.message}`);
+  });
+
+  python.stderr.on('data', (data) => {
+    aiStderr += data.toString();
+    console.error(`[Python Error]: ${data}`);
+  });
+
+  python.on('close', (code) => {
+    if (aiWorker !== python) return;
+    aiWorker = null;
+    failAiTasks(new Error(`AI Service exited with code ${code}: ${aiStderr || 'Unknown error'}`));
+  });
+
+  return python;
+};
+
+const runAiService = (jobId: string, inputPath: string, srtPath: string, onProgress: (msg: any) => void) =>
+  new Promise<void>((resolve, reject) => {
+    aiTasks.set(jobId, { onProgress, resolve, reject });
+    const job = { id: jobId, input_path: inputPath, output_srt_path: srtPath };
+    getAiWorker().stdin.write(JSON.stringify(job) + '\n');
+  });
+
 // PART 1: AI Processing (Transcribe -> Translate -> SRT)
 export const processJobInitial = async (job: Job, updateJob: (id: string, partial: Partial<Job>) => void) => {
   const jobDir = path.join(DATA_DIR, job.id);
@@ -15,65 +115,13 @@ export const processJobInitial = async (job: Job, updateJob: (id: string, partia
   const srtPath = path.join(jobDir, 'bilingual.srt');
 
   try {
-    // Simulated Python interaction (would normally pass new flags to ai_service.py)
-    // We would pass: job.sourceLang, job.outputFormat, job.enTranscript, job.zhTranscript
-    
-    const pythonScript = path.join((process as any).cwd(), 'ai_service.py');
-    const pythonCommand = (process as any).platform === 'win32' ? 'python' : 'python3';
-    
-    // In a real implementation, we'd add these args:
-    // [pythonScript, inputPath, srtPath, '--source-lang', job.sourceLang, '--format', job.outputFormat, ...]
-    
-    await new Promise<void>((resolve, reject) => {
-      // Stubbing the call with existing structure but logic would change inside Python script
-      const venvPython =
-        process.platform === "win32"
-          ? path.join(process.cwd(), ".venv", "Scripts", "python.exe")
-          : path.join(process.cwd(), ".venv", "bin", "python");
-
-      const python = spawn(venvPython, [pythonScript, inputPath, srtPath], {
-        env: {
-          ...process.env,
-          STANZA_RESOURCES_DIR: path.join(process.cwd(), ".stanza"),
-        },
-      });
-
-      // Catch spawn errors (e.g., ENOENT if python is missing)
-      python.on('error', (err) => {
-        reject(new Error(`Failed to spawn python command "${pythonCommand}". Make sure Python is installed. Details: ${err.message}`));
-      });
-
-      python.stdout.on('data', (data) => {
-        const lines = data.toString().split('\n');
-        for (const line of lines) {
-          if (!line.trim()) continue;
-          try {
-            const msg = JSON.parse(line);
-            if (msg.stage) {
-              updateJob(job.id, { 
-                stage: msg.stage, 
-                progress: msg.progress, 
-                message: msg.message 
-              });
-            }
-          } catch (e) {
-            console.log(`[Python Log]: ${line}`);
-          }
-        }
-      });
-
-      let errorOutput = '';
-      python.stderr.on('data', (data) => {
-        errorOutput += data.toString();
-        console.error(`[Python Error]: ${data}`);
-      });
-
-      python.on('close', (code) => {
-        if (code !== 0) {
-          reject(new Error(`AI Service failed: ${errorOutput || 'Unknown error'}`));
-        } else {
-          resolve();
-        }
+    // In a real implementation, we'd add these to the job line:
+    // job.sourceLang, job.outputFormat, job.enTranscript, job.zhTranscript
+    await runAiService(job.id, inputPath, srtPath, (msg) => {
+      updateJob(job.id, { 
+        stage: msg.stage, 
+        progress: msg.progress, 
+        message: msg.message 
       });
     });
 
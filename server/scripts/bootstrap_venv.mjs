@@ -46,5 +46,22 @@ run(
   { env: { ...process.env, STANZA_RESOURCES_DIR: stanzaDir } }
 );
 
+// 4) Optionally compile the Cython SRT formatter (ai_service.py falls back to pure Python).
+//    Cython itself comes from requirements.txt; skip the build while the extension is up to date.
+const fastSrc = path.join(cwd, "_srt_fast.pyx");
+const fastSrcMtime = fs.statSync(fastSrc).mtimeMs;
+const fastBuilt = fs
+  .readdirSync(cwd)
+  .filter((f) => /^_srt_fast.*\.(so|pyd)$/.test(f))
+  .some((f) => fs.statSync(path.join(cwd, f)).mtimeMs >= fastSrcMtime);
+
+if (!fastBuilt) {
+  console.log("⚙️  Building optional _srt_fast extension...");
+  const build = spawnSync(pythonBin, ["-m", "Cython.Build.Cythonize", "-i", "_srt_fast.pyx"], { stdio: "inherit", cwd });
+  if (build.status !== 0) {
+    console.warn("⚠️  _srt_fast build failed (no C compiler?); using the pure-Python SRT formatter.");
+  }
+}
+
 console.log("✅ Venv ready:", pythonBin);
 console.log("✅ Stanza dir:", stanzaDir);
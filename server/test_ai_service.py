@@ -0,0 +1,57 @@
+"""
+Regression checks for the pure-Python SRT helpers in ai_service.py.
+Run from server/:  python -m pytest -q
+"""
+
+import json
+import random
+
+import ai_service
+from ai_service import Segment, clean_one_line, prepare_cues, split_text_chunks, write_bilingual_srt
+
+
+def test_prepare_cues_punctuation_join_is_single_spaced():
+    cues = prepare_cues(Segment(0, 3, "Hi, you. Ok, the quick brown fox"), 20)
+    assert [c.text for c in cues] == ["Hi, you. Ok,", "the quick brown fox"]
+    assert all(c.text == clean_one_line(c.text) for c in cues)
+
+
+def test_write_bilingual_srt_lines_are_clean(tmp_path):
+    rng = random.Random(0)
+    words = ["Hi,", "you.", "Ok,", "the", "quick", "brown", "fox!", "  ", "\n", "中文。", "wait..."]
+    segments = [
+        Segment(i, i + 2, " ".join(rng.choice(words) for _ in range(rng.randint(1, 15)))) for i in range(300)
+    ]
+    out = tmp_path / "out.srt"
+    write_bilingual_srt(
+        segments,
+        out,
+        translate_batch=lambda xs: [f"<{x}>" for x in xs],
+        source_is_zh=False,
+        max_chars_src=20,
+    )
+
+    blocks = out.read_text(encoding="utf-8").strip().split("\n\n")
+    for block in blocks:
+        _idx, _ts, en, zh = block.split("\n")
+        assert en and en == clean_one_line(en)
+        assert zh == f"<{en}>"
+
+
+def test_emit_flushes_coalesced_update_on_stage_change(capsys):
+    ai_service.emit("transcribe", 28, "Receiving segments...")
+    ai_service.emit("transcribe", 40, "Transcription complete. Detected language: en")
+    ai_service.emit("translate", 50, "Translating remaining cues...")
+    ai_service.flush_progress()
+
+    messages = [line for line in capsys.readouterr().out.splitlines() if line]
+    assert [json.loads(m)["progress"] for m in messages] == [28, 40, 50]
+
+
+def test_split_text_chunks_hard_slices_need_no_strip():
+    rng = random.Random(1)
+    pieces = ["a", "bb", " ", "  ", ",", ".", "。", "中", "\n", "xxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"]
+    for _ in range(2000):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 60)))
+        for chunk in split_text_chunks(text, rng.randint(1, 30)):
+            assert chunk and chunk == clean_one_line(chunk)